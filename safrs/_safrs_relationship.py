@@ -9,7 +9,6 @@ class SAFRSRelationshipObject:
     so we can call the same methods on a relationship target as we do when using SAFRSBase
     """
 
-    _s_class_name = None
     __name__ = "name"
     http_methods = {"GET", "POST", "PATCH", "DELETE"}
     swagger_models = {"instance": None, "collection": None}
@@ -56,10 +55,3 @@ class SAFRSRelationshipObject:
         :return: JSON:API type
         """
         return cls._target._s_type
-
-    @classproperty
-    def _s_class_name(cls):
-        """
-        :return: name of the target class
-        """
-        return cls._target.__name__
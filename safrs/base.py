@@ -5,13 +5,17 @@
 from __future__ import annotations
 import inspect
 import datetime
+import decimal
+import uuid
 import sqlalchemy
 import json
 import operator
+from itertools import islice
 from http import HTTPStatus
-from urllib.parse import urljoin
+from urllib.parse import urljoin, quote
 from flask import request, url_for, has_request_context, current_app, g
 from flask_sqlalchemy.model import Model
+from sqlalchemy.orm import object_session, selectinload
 from sqlalchemy.orm.session import make_transient
 from sqlalchemy import inspect as sqla_inspect, or_
 from sqlalchemy.orm.interfaces import ONETOMANY, MANYTOONE, MANYTOMANY
@@ -19,6 +23,13 @@ from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 from sqlalchemy.sql.schema import Column
 from functools import lru_cache
 
+try:
+    # optional dependency: C-level json encoding for the attribute values that
+    # aren't handled by the type dispatch table below
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # safrs dependencies:
 import safrs
 import safrs.jsonapi
@@ -73,6 +84,39 @@ SQLALCHEMY_SWAGGER2_TYPE = {
 # casting of swagger types to python types
 SWAGGER2_TYPE_CAST = {"integer": int, "string": str, "number": float, "boolean": bool}
 
+#
+# Direct coercions for common attribute value types, keyed by exact type.
+# These mirror the json encoder output without paying for a full
+# json.dumps + json.loads round-trip per attribute; `None` means the value is
+# already json-serializable and can be used as-is. Values of other types
+# (nested dicts, custom classes, subclasses) still take the encoder round-trip
+#
+_ATTR_COERCIONS = {
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+    datetime.datetime: lambda val: val.isoformat(" "),
+    datetime.date: lambda val: val.isoformat(),
+    datetime.time: lambda val: val.isoformat(),
+    datetime.timedelta: str,
+    decimal.Decimal: float,
+    uuid.UUID: str,
+    bytes: lambda val: val.hex(),
+    bytearray: lambda val: val.hex(),
+    memoryview: lambda val: val.hex(),
+}
+
+# Comparison operators accepted by the `filter=` query parameter (cfr. `_s_filter`),
+# keyed by the normalized (underscore-stripped) operator name
+_FILTER_OPS = {name.strip("_"): getattr(operator, name) for name in ("eq", "ne", "lt", "le", "gt", "ge", "is_", "is_not")}
+
+# Default `_s_get_swagger_doc` responses, built once (callers mutate the top
+# level of the returned dict, so they get a shallow copy)
+_SWAGGER_GET_RESPONSES = {HTTPStatus.NOT_FOUND.value: {"description": HTTPStatus.NOT_FOUND.description}}
+_SWAGGER_POST_RESPONSES = {HTTPStatus.CREATED.value: {"description": HTTPStatus.CREATED.description}}
+
 
 #
 # SAFRSBase superclass
@@ -105,6 +149,26 @@ class SAFRSBase(Model):
     # Cached lookup tables
     _col_attr_name_map = None
     _attr_col_name_map = None
+    # Serialization caches, built per class by `_s_build_class_caches`
+    _cached_jsonapi_attrs = None
+    _cached_permitted_attrs = None
+    _cached_attr_readers = None
+    _cached_relationships = None
+    # Permission sets, built per class by `_s_build_perm_sets`
+    _s_readable_attrs = None
+    _s_writable_attrs = None
+    _s_exposed_rels = None
+    # Column tuples, built per class by `_s_build_class_caches`
+    _s_all_columns = None
+    _s_exposed_columns = None
+    _s_column_keys = None
+    _s_post_allowed_attrs = None
+    _s_attr_getters = None
+    _s_sample_dict_cached = None
+    _s_sample_id_cached = None
+    # Names of the classproperties materialized by `_s_build_class_caches`,
+    # so a rebuild can tell its own values apart from user-assigned strings
+    _s_materialized_props = frozenset()
 
     # Resource classes for the collections, relationships and methods
     # overriding these allows you to extend the Resource http methods: get(), post(), patch(), delete()
@@ -125,7 +189,9 @@ class SAFRSBase(Model):
         """
         If an object with given arguments already exists, this object is instantiated
         """
-        if "id" not in kwargs or not cls._s_upsert:
+        if not kwargs.get("id") or not cls._s_upsert:
+            # no id was provided (the common POST path generates a fresh one in __init__),
+            # so there is no existing object to look up
             return object.__new__(cls)
         # Fetch the PKs from the kwargs so we can lookup the corresponding object
         primary_keys = cls.id_type.extract_pks(kwargs)
@@ -160,21 +226,25 @@ class SAFRSBase(Model):
         # kwargs dictionary (from json in case of a web request).
         # Retrieve the values from each attribute (== class table column)
         db_args = {}
-        column_names = [c.key for c in self._s_columns]
+        in_request_context = has_request_context()
+        column_keys = self._s_column_keys
+        if column_keys is None:
+            # mappers not configured yet, fall back to the column scan
+            column_keys = frozenset(c.key for c in self._s_columns)
         for name, val in kwargs.items():
             if name in self._s_relationships:
                 # Add the related instances
                 db_args[name] = val
             elif is_jsonapi_attr(getattr(self.__class__, name, None)):
                 # Set jsonapi attributes
-                attr_val = self._s_parse_attr_value(name, val)
+                attr_val = self._s_parse_attr_value(name, val, in_request_context)
                 setattr(self, name, attr_val)
-            elif name in column_names:
+            elif name in column_keys:
                 # Set columns
-                attr_val = self._s_parse_attr_value(name, val)
+                attr_val = self._s_parse_attr_value(name, val, in_request_context)
                 db_args[name] = attr_val
             elif name in self.__class__._s_jsonapi_attrs:
-                db_args[name] = self._s_parse_attr_value(name, val)
+                db_args[name] = self._s_parse_attr_value(name, val, in_request_context)
 
         # db_args now contains the class attributes. Initialize the DB model with them
         # All subclasses should have the DB.Model as superclass.
@@ -208,15 +278,19 @@ class SAFRSBase(Model):
         else:
             return super().__setattr__(attr_name, attr_val)
 
-    def _s_parse_attr_value(self, attr_name: str, attr_val: any):
+    def _s_parse_attr_value(self, attr_name: str, attr_val: any, in_request_context: bool = None):
         """
         Parse the given jsonapi attribute value so it can be stored in the db
         :param attr_name: attribute name
         :param attr_val: attribute value
+        :param in_request_context: pre-evaluated `has_request_context()`, so callers
+            parsing several attributes only pay the thread-local lookup once
         :return: parsed value
         """
         # Don't allow attributes from web requests that are not specified in _s_jsonapi_attrs
-        if not has_request_context():
+        if in_request_context is None:
+            in_request_context = has_request_context()
+        if not in_request_context:
             # we only care about parsing when working in the request context
             return attr_val
 
@@ -252,20 +326,23 @@ class SAFRSBase(Model):
         `_s_post` performs attribute sanitization and calls `cls.__init__`
         The attributes may contain an "id" if `cls.allow_client_generated_ids` is True
         """
-        # remove attributes that are not declared in _s_jsonapi_attrs
-        attributes = {attr_name: params[attr_name] for attr_name in params if attr_name in cls._s_jsonapi_attrs}
-
-        # Remove 'id' (or other primary keys) from the attributes, unless it is allowed by the
+        # Keep only the attributes that are declared in _s_jsonapi_attrs and drop
+        # 'id' (or other primary keys), unless it is allowed by the
         # SAFRSObject allow_client_generated_ids attribute
         if cls.allow_client_generated_ids:
+            attributes = {attr_name: params[attr_name] for attr_name in params if attr_name in cls._s_jsonapi_attrs}
             # this isn't required per the jsonapi spec
             # the user may have supplied the PK in one of the attributes, in which case "id" will be ignored
             attributes["id"] = jsonapi_id if jsonapi_id is not None else params.get("id", None)
         else:
-            for attr_name in attributes.copy():
-                if attr_name in cls.id_type.column_names:
-                    safrs.log.warning(f"Client generated IDs are not allowed ('allow_client_generated_ids' not set for {cls})")
-                    del attributes[attr_name]
+            allowed_attrs = cls._s_post_allowed_attrs
+            if allowed_attrs is None:  # pragma: no cover
+                allowed_attrs = frozenset(cls._s_jsonapi_attrs).difference(cls.id_type.column_names)
+            attributes = {attr_name: params[attr_name] for attr_name in params if attr_name in allowed_attrs}
+            if len(attributes) != len(params):
+                for attr_name in params.keys() - attributes.keys():
+                    if attr_name in cls._s_jsonapi_attrs:
+                        safrs.log.warning(f"Client generated IDs are not allowed ('allow_client_generated_ids' not set for {cls})")
 
         # Create the object instance with the specified id and json data
         # If the instance (id) already exists, it will be updated with the data
@@ -282,28 +359,52 @@ class SAFRSBase(Model):
             # in that case we have to do it ourselves
             #
             safrs.DB.session.add(instance)
-            try:
-                safrs.DB.session.commit()
-            except sqlalchemy.exc.SQLAlchemyError as exc:  # pragma: no cover
-                # Exception may arise when a db constraint has been violated
-                # (e.g. duplicate key)
-                safrs.log.warning(str(exc))
-                raise GenericError(str(exc))
+            cls._schedule_commit(instance)
 
         return instance
 
+    @classmethod
+    def _schedule_commit(cls, instance):
+        """
+        Commit the session, or defer the commit to the end of the request when
+        the BATCH_COMMITS config is enabled (one commit per request instead of
+        one per created instance)
+        :param instance: instance pending in the session
+        """
+        if get_config("BATCH_COMMITS") and has_request_context():
+            # flush so db-generated values (ex. autoincrement primary keys) are
+            # assigned before the deferred instance is serialized in the response
+            safrs.DB.session.flush()
+            pending = getattr(g, "_safrs_pending", None)
+            if pending is None:
+                pending = g._safrs_pending = []
+            pending.append(instance)
+            return
+        try:
+            safrs.DB.session.commit()
+        except sqlalchemy.exc.SQLAlchemyError as exc:  # pragma: no cover
+            # Exception may arise when a db constraint has been violated
+            # (e.g. duplicate key)
+            safrs.log.warning(str(exc))
+            raise GenericError(str(exc))
+
     def _s_patch(self, **attributes) -> SAFRSBase:
         """
         Update the object attributes
         :param **attributes:
         """
+        in_request_context = has_request_context()
+        cls = self.__class__
+        jsonapi_attrs = cls._s_jsonapi_attrs  # also builds the permission sets if needed
+        writable_attrs = cls._s_writable_attrs
+        exposed_rels = cls._s_exposed_rels
         for attr_name, attr_val in attributes.items():
-            if attr_name not in self.__class__._s_jsonapi_attrs:
+            if attr_name not in jsonapi_attrs:
                 continue
             # check if we have permission to write
-            if not self._s_check_perm(attr_name, "w"):
+            if attr_name not in writable_attrs and attr_name not in exposed_rels:
                 continue
-            attr_val = self._s_parse_attr_value(attr_name, attr_val)
+            attr_val = self._s_parse_attr_value(attr_name, attr_val, in_request_context)
             setattr(self, attr_name, attr_val)
 
         safrs.DB.session.commit()
@@ -369,144 +470,148 @@ class SAFRSBase(Model):
                 break
         return subclasses
 
-    @hybrid_property
-    def http_methods(self) -> list[str]:
-        """
-        :return: list of allowed HTTP methods
-        """
-        return self.__class__.http_methods
-
-    @http_methods.expression
-    def http_methods(self) -> list[str]:
+    @classproperty
+    def http_methods(cls) -> list[str]:
         """
         :return: list of allowed HTTP methods
         """
         return ["GET", "POST", "PATCH", "DELETE", "PUT", "HEAD", "OPTIONS"]
 
     @classproperty
-    @lru_cache(maxsize=32)
-    def _s_columns(cls) -> list:
+    def _s_columns(cls) -> tuple:
         """
-        :return: list of columns that are exposed by the api
+        :return: tuple of columns that are exposed by the api
         """
-        if not hasattr(cls, "__mapper__"):
-            return []
-
-        result = cls.__mapper__.columns
+        if cls.__dict__.get("_s_all_columns") is None:
+            if not hasattr(cls, "__mapper__"):
+                return ()
+            cls._s_build_class_caches()
 
         if has_request_context():
             # In the web context we only return the attributes that are exposable and readable
             # i.e. where the "expose" attribute is set on the db.Column instance
             # and the "r" flag is in the permissions
-            result = [c for c in result if cls._s_check_perm(cls.colname_to_attrname(c.name))]
-        return result
-
-    @hybrid_property
-    def _s_relationships(self) -> dict:
-        """
-        :return: the relationships used for jsonapi (de/)serialization
-        """
-        rels = {rel.key: rel for rel in self.__mapper__.relationships if self._s_check_perm(rel.key)}
-        return rels
+            return cls._s_exposed_columns
+        return cls._s_all_columns
 
-    @_s_relationships.expression
-    def _s_relationships(cls):
+    @classproperty
+    def _s_relationships(cls) -> dict:
         """
         :return: the relationships used for jsonapi (de/)serialization
         """
-        rels = {rel.key: rel for rel in cls.__mapper__.relationships if cls._s_check_perm(rel.key)}
+        rels = cls.__dict__.get("_cached_relationships")
+        if rels is None:
+            cls._s_build_class_caches()
+            rels = cls._cached_relationships
         return rels
 
     @classmethod
-    def colname_to_attrname(cls, col_name):
+    def _s_build_colname_maps(cls) -> None:
         """
-        Map column name to model attribute name
-
-        We want this:
+        Create the lookup tables for the attr <-> col name mapping, i.e.
         ```
             for attr_name, attr_val in cls.__dict__.items():
                 if col_name == getattr(attr_val, "name", None):
                     return attr_name
             return col_name
         ```
-        To avoid executing this loop over and over, we create a lookup table when performing the first lookup
-        (this is slightly faster than using lru_cache)
+        unrolled into two dicts. This is called once per class from
+        `_s_build_class_caches` so requests never pay for (or race on) the scan
         """
+        col_attr_name_map = {}
+        attr_col_name_map = {}
+        for attr_name, attr_val in cls.__dict__.items():
+            if attr_name.startswith("__") and attr_name.endswith("__"):
+                # skip dunder attributes
+                continue
+            _col_name = getattr(attr_val, "name", attr_name)
+            if attr_name == "type":
+                attr_name = "Type"
+            col_attr_name_map[_col_name] = attr_name
+            attr_col_name_map[attr_name] = _col_name
+        cls._col_attr_name_map = col_attr_name_map
+        cls._attr_col_name_map = attr_col_name_map
 
-        if cls._col_attr_name_map is None:
-            # create lookup tables for attr <-> col mapping
-            cls._col_attr_name_map = {}
-            cls._attr_col_name_map = {}
-            for attr_name, attr_val in cls.__dict__.items():
-                if attr_name.startswith("__") and attr_name.endswith("__"):
-                    # skip dunder attributes
-                    continue
-                _col_name = getattr(attr_val, "name", attr_name)
-                if attr_name == "type":
-                    attr_name = "Type"
-                cls._col_attr_name_map[_col_name] = attr_name
-                cls._attr_col_name_map[attr_name] = _col_name
-
-        return cls._col_attr_name_map[col_name]
-
-    @hybrid_method
-    def _s_check_perm(self, property_name, permission="r") -> bool:
+    @classmethod
+    def colname_to_attrname(cls, col_name):
         """
-        Check the (instance-level) column permission
-        :param column_name: column name
-        :param permission: permission string (read/write)
-        :return: Boolean indicating whether access is allowed
+        Map column name to model attribute name
         """
+        if cls._col_attr_name_map is None:
+            cls._s_build_colname_maps()
 
-        return self.__class__._s_check_perm(property_name, permission)
+        return cls._col_attr_name_map[col_name]
 
-    @_s_check_perm.expression
-    @lru_cache(maxsize=256)
+    @classmethod
     def _s_check_perm(cls, property_name, permission="r") -> bool:
         """
-        Check the (class-level) column permission
-        :param column_name: column name
+        Check the column permission
+        :param property_name: attribute or relationship name
         :param permission: permission string (read/write)
         :return: Boolean indicating whether access is allowed
         """
-        if property_name.startswith("_"):
-            return False
-
-        if property_name in cls.exclude_attrs:
-            return False
+        if cls.__dict__.get("_s_readable_attrs") is None:
+            cls._s_build_colname_maps()
+            cls._s_build_perm_sets()
 
-        if is_jsonapi_attr(cls.__dict__.get(property_name, None)):  # avoid getattr here
+        if property_name in cls._s_exposed_rels:
             return True
+        allowed_attrs = cls._s_readable_attrs if permission == "r" else cls._s_writable_attrs
+        return property_name in allowed_attrs
 
-        if not hasattr(cls, "__mapper__"):
-            # Stateless objects
-            return False
-
-        for rel in cls.__mapper__.relationships:
-            if not cls.supports_includes:
-                continue
-            if rel.key != property_name:
-                continue
-            if rel.key in cls.exclude_rels:
-                # relationship name has been set in exclude_rels
-                return False
-            if not getattr(rel.mapper.class_, "_s_expose", False):
-                # only SAFRSBase instances can be exposed
-                return False
-            if not getattr(rel, "expose", True):
-                # relationship `expose` attribute has explicitly been set to False
-                return False
-            return True
+    @classmethod
+    def _s_build_perm_sets(cls) -> None:
+        """
+        Precompute the permission sets used by `_s_check_perm`, turning the
+        per-property scan of the mapper columns and relationships into a
+        set membership test. Built once per class by `_s_build_class_caches`
+        """
+        readable = set()
+        writable = set()
+        exposed_rels = set()
+        rel_keys = set()
 
-        for column in cls.__mapper__.columns:
-            # don't expose attributes starting with an underscore
-            if cls.colname_to_attrname(column.name) != property_name:
-                continue
-            if getattr(column, "expose", True) and permission in getattr(column, "permissions", "rw"):
-                return True
-            return False
+        for attr_name, attr_val in cls.__dict__.items():
+            # don't expose attributes starting with an underscore or added to exclude_attrs
+            if is_jsonapi_attr(attr_val) and not attr_name.startswith("_") and attr_name not in cls.exclude_attrs:
+                readable.add(attr_name)
+                writable.add(attr_name)
+
+        ja_attr_names = frozenset(readable)
+
+        if hasattr(cls, "__mapper__"):
+            if cls.supports_includes:
+                for rel in cls.__mapper__.relationships:
+                    rel_keys.add(rel.key)
+                    if rel.key.startswith("_") or rel.key in cls.exclude_attrs or rel.key in cls.exclude_rels:
+                        # relationship name has been set in exclude_rels
+                        continue
+                    if not getattr(rel.mapper.class_, "_s_expose", False):
+                        # only SAFRSBase instances can be exposed
+                        continue
+                    if not getattr(rel, "expose", True):
+                        # relationship `expose` attribute has explicitly been set to False
+                        continue
+                    exposed_rels.add(rel.key)
+
+            col_attr_name_map = cls._col_attr_name_map or {}
+            for column in cls.__mapper__.columns:
+                attr_name = col_attr_name_map.get(column.name, column.name)
+                if attr_name.startswith("_") or attr_name in cls.exclude_attrs:
+                    continue
+                if attr_name in rel_keys or attr_name in ja_attr_names:
+                    # the relationship and jsonapi_attr checks take precedence over the column flags
+                    continue
+                if getattr(column, "expose", True):
+                    permissions = getattr(column, "permissions", "rw")
+                    if "r" in permissions:
+                        readable.add(attr_name)
+                    if "w" in permissions:
+                        writable.add(attr_name)
 
-        raise SystemValidationError(f"Invalid property {property_name}")
+        cls._s_readable_attrs = frozenset(readable)
+        cls._s_writable_attrs = frozenset(writable)
+        cls._s_exposed_rels = frozenset(exposed_rels)
 
     @hybrid_property
     def _s_jsonapi_attrs(self):
@@ -522,38 +627,46 @@ class SAFRSBase(Model):
             of that type in its response.
         Therefore we extract the required fieldnames from the request args, eg. Users/?Users[name] => [name]
         """
-        fields = self.__class__._s_jsonapi_attrs.keys()
+        cls = self.__class__
+        fields = cls._s_jsonapi_attrs.keys()  # also builds the class caches if needed
         if has_request_context():
             fields = request.fields.get(self._s_class_name, fields)
 
         result = {}
-        ja_attr_names = [name for name in self.__class__._s_jsonapi_attrs.keys() if self._s_check_perm(name)]
+        # attr name -> value reader, precomputed by _s_build_class_caches
+        attr_getters = cls._s_attr_getters
 
         for attr in fields:
-            attr_val = ""
-            attr_name = attr
-            if attr in ja_attr_names:
-                if hasattr(self, attr):
-                    attr_val = getattr(self, attr)
-                else:
-                    col_name = self.colname_to_attrname(attr)
-                    attr_val = getattr(self, col_name)
+            getter = attr_getters.get(attr)
+            attr_val = "" if getter is None else getter(self)
             try:
-                # use the current_app json_encoder
-                if current_app:
-                    result[attr_name] = json.loads(json.dumps(attr_val, cls=current_app.json_encoder))
+                val_type = type(attr_val)
+                if val_type in _ATTR_COERCIONS:
+                    coerce = _ATTR_COERCIONS[val_type]
+                    result[attr] = attr_val if coerce is None else coerce(attr_val)
+                elif current_app:
+                    if orjson is not None:
+                        # single C-level encode/decode pass; datetimes are passed through
+                        # to the app's json default so the formatting stays the same,
+                        # and non-str dict keys are coerced like the stdlib encoder does
+                        result[attr] = orjson.loads(
+                            orjson.dumps(
+                                attr_val,
+                                default=current_app.json.default,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+                            )
+                        )
+                    else:
+                        # use the current_app json_encoder
+                        result[attr] = json.loads(json.dumps(attr_val, cls=current_app.json_encoder))
                 else:
-                    result[attr_name] = attr_val
-            except UnicodeDecodeError:  # pragma: no cover
-                safrs.log.warning(f"UnicodeDecodeError fetching {self}.{attr}")
-                result[attr] = ""
+                    result[attr] = attr_val
             except Exception as exc:
                 safrs.log.warning(f"Failed to fetch {self}.{attr}: {exc}")
 
         return result
 
     @_s_jsonapi_attrs.expression
-    @lru_cache(maxsize=32)
     def _s_jsonapi_attrs(cls):
         """
         :return: dict of jsonapi attributes
@@ -561,15 +674,70 @@ class SAFRSBase(Model):
         Things will go south if this isn't the case and we should use
         the cls.__mapper__._polymorphic_properties instead
         """
-        # Cache this for better performance (a bit faster than lru_cache :)
-        cached_attrs = getattr(cls, "_cached_jsonapi_attrs", None)
-        if cached_attrs is not None:
-            return cached_attrs
+        # Built by the `mapper_configured` listener at startup, or here on
+        # first use for classes without a mapper
+        cached_attrs = cls.__dict__.get("_cached_jsonapi_attrs")
+        if cached_attrs is None:
+            cached_attrs = cls._s_build_class_caches()
+        return cached_attrs
+
+    @classmethod
+    def _s_build_class_caches(cls) -> dict:
+        """
+        Precompute the serialization lookup tables for this class:
+        - `_cached_jsonapi_attrs`: the exposed jsonapi attribute names mapped to their column (or jsonapi_attr)
+        - `_cached_permitted_attrs`: frozenset of the readable attribute names
+        - `_cached_attr_readers`: attribute name -> the name used to read the value from an instance
+
+        This runs once per class (from the sqla `after_configured` event) so the
+        serialization hot path doesn't have to rebuild the permission and name
+        lookups for every instance
+        :return: the jsonapi attribute dict
+        """
+        cls._s_build_colname_maps()
+        cls._s_build_perm_sets()
+        col_attr_name_map = cls._col_attr_name_map
+
+        all_columns = tuple(cls.__mapper__.columns) if hasattr(cls, "__mapper__") else ()
+        cls._s_all_columns = all_columns
+        cls._s_column_keys = frozenset(column.key for column in all_columns)
+        if all_columns:
+            # resolve the id type once: instances read a plain class attribute
+            # instead of going through the descriptor on every access.
+            # `id_type` is also a documented extension point (cfr. safrs_types),
+            # so like _s_type below we only overwrite the SAFRSBase descriptor
+            # or a value a previous build materialized, never a user assignment
+            owner = next(klass for klass in cls.__mro__ if "id_type" in klass.__dict__)
+            if owner is SAFRSBase or "id_type" in owner.__dict__.get("_s_materialized_props", ()):
+                cls.id_type = get_id_type(cls, delimiter=cls._s_pk_delimiter)
+                cls._s_materialized_props = cls.__dict__.get("_s_materialized_props", frozenset()) | {"id_type"}
+        # materialize the cheap-but-hot classproperties as plain class attributes,
+        # unless a subclass provides its own implementation: only overwrite the
+        # descriptor inherited from SAFRSBase or a value a previous build
+        # materialized (tracked in `_s_materialized_props`), never a plain
+        # string a user class assigned itself (ex. `_s_type = "TestType"`)
+        for prop_name, prop_val in (("_s_type", cls.__name__), ("_s_object_id", cls.__name__ + get_config("OBJECT_ID_SUFFIX"))):
+            owner = next(klass for klass in cls.__mro__ if prop_name in klass.__dict__)
+            if owner is SAFRSBase or prop_name in owner.__dict__.get("_s_materialized_props", ()):
+                setattr(cls, prop_name, prop_val)
+                cls._s_materialized_props = cls.__dict__.get("_s_materialized_props", frozenset()) | {prop_name}
+        cls._s_exposed_columns = tuple(
+            column
+            for column in all_columns
+            if col_attr_name_map.get(column.name, column.name) in cls._s_readable_attrs
+            or col_attr_name_map.get(column.name, column.name) in cls._s_exposed_rels
+        )
+        if hasattr(cls, "__mapper__"):
+            cls._cached_relationships = {rel.key: rel for rel in cls.__mapper__.relationships if rel.key in cls._s_exposed_rels}
+        else:
+            cls._cached_relationships = {}
 
         result = {}
-        for column in cls._s_columns:
-            attr_name = cls.colname_to_attrname(column.name)
-            if not cls._s_check_perm(attr_name):
+        readable_attrs = cls._s_readable_attrs
+        exposed_rels = cls._s_exposed_rels
+        for column in all_columns:
+            attr_name = col_attr_name_map[column.name]
+            if attr_name not in readable_attrs and attr_name not in exposed_rels:
                 continue
             # jsonapi schema prohibits the use of the fields 'id' and 'type' in the attributes
             # http://jsonapi.org/format/#document-resource-object-fields
@@ -583,15 +751,31 @@ class SAFRSBase(Model):
             if is_jsonapi_attr(attr_val):
                 result[attr_name] = attr_val
 
+        attr_readers = {}
+        for attr_name in result:
+            if hasattr(cls, attr_name):
+                attr_readers[attr_name] = attr_name
+            else:
+                attr_readers[attr_name] = col_attr_name_map.get(attr_name, attr_name)
+
+        cls._cached_permitted_attrs = frozenset(attr_readers)
+        cls._cached_attr_readers = attr_readers
+        # attrgetter is implemented in C and noticeably faster than getattr with
+        # a string in the serialization loop
+        cls._s_attr_getters = {attr_name: operator.attrgetter(reader) for attr_name, reader in attr_readers.items()}
         cls._cached_jsonapi_attrs = result
+        if all_columns:
+            # attributes accepted by `_s_post` when client generated ids are disabled
+            cls._s_post_allowed_attrs = frozenset(result).difference(cls.id_type.column_names)
+        else:
+            cls._s_post_allowed_attrs = frozenset(result)
         return result
 
     def _s_expunge(self):
         """
         expunge an object from its session
         """
-        session = sqla_inspect(self).session
-        session.expunge(self)
+        object_session(self).expunge(self)
 
     @classproperty
     def _s_auto_commit(self):
@@ -627,6 +811,28 @@ class SAFRSBase(Model):
             safrs.DB.session.commit()
         return self
 
+    @classmethod
+    def _s_get_pks(cls, jsonapi_id) -> dict:
+        """
+        Parse a jsonapi id into its primary key dict, memoized on `g` for the
+        duration of the request: the same id is typically parsed several times
+        per request (lookup + re-serialization), and composite ids pay a regex
+        parse per call
+        :param jsonapi_id: jsonapi_id
+        :return: primary key dict
+        """
+        if not has_request_context():
+            return cls.id_type.get_pks(jsonapi_id)
+
+        cache = getattr(g, "_safrs_pk_cache", None)
+        if cache is None:
+            cache = g._safrs_pk_cache = {}
+        key = (cls, jsonapi_id)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = cls.id_type.get_pks(jsonapi_id)
+        return result
+
     @classmethod
     def get_instance(cls, item=None, failsafe=False):
         """
@@ -645,7 +851,7 @@ class SAFRSBase(Model):
         else:
             id = item
         try:
-            primary_keys = cls.id_type.get_pks(id)
+            primary_keys = cls._s_get_pks(id)
         except AttributeError:  # pragma: no cover
             # This happens when we request a sample from a class that is not yet loaded
             # when we're creating the swagger models
@@ -654,7 +860,10 @@ class SAFRSBase(Model):
 
         if id is not None or not failsafe:
             try:
-                instance = cls._s_query.filter_by(**primary_keys).first()
+                # session.get goes through the identity map: no SQL is emitted
+                # when the instance is already loaded in the session
+                if None not in primary_keys.values():
+                    instance = safrs.DB.session.get(cls, primary_keys)
             except Exception as exc:  # pragma: no cover
                 raise GenericError(f"get_instance : {exc}")
 
@@ -668,7 +877,7 @@ class SAFRSBase(Model):
         :param jsonapi_id: jsonapi_id
         :return: query obj
         """
-        primary_keys = cls.id_type.get_pks(jsonapi_id)
+        primary_keys = cls._s_get_pks(jsonapi_id)
         return cls._s_query.filter_by(**primary_keys)
 
     @property
@@ -685,14 +894,16 @@ class SAFRSBase(Model):
         return str(self.id_type.get_id(self))
 
     @classproperty
-    @lru_cache(maxsize=32)
     # pylint: disable=method-hidden
     def id_type(obj):
         """
         :return: the object's id type
+
+        Mapped classes get a plain `id_type` class attribute from `_s_build_class_caches`,
+        this descriptor only serves as a fallback for classes without a mapper
         """
         id_type = get_id_type(obj, delimiter=obj._s_pk_delimiter)
-        # monkey patch so we don't have to look it up next time
+        # cache on the class so we don't have to look it up next time
         obj.id_type = id_type
         return id_type
 
@@ -752,8 +963,9 @@ class SAFRSBase(Model):
         return cls.__name__
 
     @hybrid_method
-    def _s_jsonapi_encode(self):
+    def _s_jsonapi_encode(self, included_list=None):
         """
+        :param included_list: the relationship paths to include (from the `Included` wrapper)
         :return: Encoded object according to the jsonapi specification:
         `data = {
                 "attributes": { ... },
@@ -763,22 +975,70 @@ class SAFRSBase(Model):
                 "type": "..."
                 }`
         """
-        # params = { self.object_id : self.id }
-        # obj_url = url_for(self.get_endpoint(), **params) # Doesn't work :(, todo : why?
-        obj_url = url_for(self.get_endpoint())
-        if obj_url.endswith("/"):
-            obj_url = obj_url[:-1]
-
         self_link = self._s_url
         attributes = self.to_dict()
-        relationships = self._s_get_related()
+        relationships = self._s_get_related(included_list)
         g.ja_data.add(self)
-        data = dict(attributes=attributes, id=self.jsonapi_id, links={"self": self_link}, type=self._s_type, relationships=relationships)
+        data = {
+            "attributes": attributes,
+            "id": self.jsonapi_id,
+            "links": {"self": self_link},
+            "type": self._s_type,
+            "relationships": relationships,
+        }
 
         return data
 
-    def _s_get_related(self):
+    @classmethod
+    def _s_prefetch(cls, instances, rel_names) -> None:
+        """
+        Batch-load the given relationships for a list of instances with a single
+        query per relationship instead of one lazy load per instance (the N+1
+        query pattern when serializing collections with included relationships).
+        The instances live in the identity map, so reloading them with
+        `selectinload` populates the relationship collections that the
+        per-instance serialization will traverse afterwards.
+
+        :param instances: `cls` instances, e.g. a page of a collection result
+        :param rel_names: names of the relationships to load
+        """
+        if not instances or not hasattr(cls, "__mapper__"):
+            return
+
+        if safrs.SAFRS.INCLUDE_ALL in rel_names:
+            rel_names = cls._s_relationships
+
+        eligible = []
+        for rel_name in rel_names:
+            rel = cls._s_relationships.get(rel_name)
+            if rel is None or rel.lazy not in ("select", "joined", "subquery", "selectin"):
+                # dynamic/noload/raise relationships can't be batch-loaded
+                continue
+            eligible.append(rel_name)
+        if not eligible:
+            return
+
+        primary_key = cls.__mapper__.primary_key
+        if len(primary_key) != 1:
+            # composite primary keys aren't batched
+            return
+        pk_col = primary_key[0]
+        pks = [pk for pk in (getattr(instance, pk_col.key, None) for instance in instances) if pk is not None]
+        if not pks:
+            return
+
+        query = cls._s_query.filter(pk_col.in_(pks))
+        for rel_name in eligible:
+            query = query.options(selectinload(getattr(cls, rel_name)))
+        try:
+            query.all()
+        except Exception as exc:  # pragma: no cover
+            safrs.log.warning(f"Relationship prefetch failed for {cls}: {exc}")
+
+    def _s_get_related(self, included_list=None):
         """
+        :param included_list: the relationship paths to include, provided by the
+            `Included` wrapper for recursive includes
         :return: dict of relationship names -> [related instances]
 
         http://jsonapi.org/format/#fetching-includes
@@ -798,29 +1058,56 @@ class SAFRSBase(Model):
             include=friends.books_read,friends.books_written
         """
         # included_list contains a list of relationships to include
-        # it may have been set previously by Included() when called recursively
-        # if it's not set, parse the include= request param here
+        # it is passed in for recursive includes and may also have been set on the
+        # instance (e.g. by _add_rels); if neither, parse the include= request param here
         # included_list example: ['friends.books_read', 'friends.books_written']
-        included_list = getattr(self, "included_list", None)
         if included_list is None:
+            included_list = getattr(self, "included_list", None)
+        # The parsed request args are the same for every instance in a
+        # collection response, parse them once per request and keep them on `g`
+        request_args = getattr(g, "_safrs_include_args", None)
+        if request_args is None:
             # Multiple related resources can be requested in a comma-separated list
             included_csv = request.args.get("include", safrs.SAFRS.DEFAULT_INCLUDED)
-            included_list = [inc for inc in included_csv.split(",") if inc]
+            if included_csv:
+                request_included_list = [inc for inc in included_csv.split(",") if inc]
+                request_included_rels = {i.split(".", 1)[0] for i in request_included_list}
+            else:
+                # the common case: no includes requested, skip the parsing
+                request_included_list = []
+                request_included_rels = frozenset()
+            excluded_csv = request.args.get("exclude", "")
+            request_args = g._safrs_include_args = (request_included_list, excluded_csv.split(","), request_included_rels)
 
-        excluded_csv = request.args.get("exclude", "")
-        excluded_list = excluded_csv.split(",")
-        # In order to recursively request related resources
-        # a dot-separated path for each relationship name can be specified
-        included_rels = {i.split(".")[0] for i in included_list}
+        excluded_list = request_args[1]
+        if included_list is None:
+            included_list = request_args[0]
+            included_rels = request_args[2]
+        else:
+            # included_list was set by Included() for a recursive include:
+            # in order to recursively request related resources
+            # a dot-separated path for each relationship name can be specified
+            included_rels = {i.split(".")[0] for i in included_list}
         relationships = dict()
 
-        for rel_name in included_rels:
-            """
-            If a server is unable to identify a relationship path or does not support inclusion of resources from a path,
-            it MUST respond with 400 Bad Request.
-            """
-            if rel_name != safrs.SAFRS.INCLUDE_ALL and rel_name not in self._s_relationships:
-                raise GenericError(f"Invalid Relationship '{rel_name}'", status_code=400)
+        # If a server is unable to identify a relationship path or does not support inclusion of resources from a path,
+        # it MUST respond with 400 Bad Request.
+        unknown_rels = set(included_rels).difference(self._s_relationships)
+        unknown_rels.discard(safrs.SAFRS.INCLUDE_ALL)
+        if unknown_rels:
+            raise GenericError(f"Invalid Relationship '{unknown_rels.pop()}'", status_code=400)
+
+        # index the recursive include paths by their head relationship, so the
+        # loop below doesn't rescan and resplit every path for every relationship
+        next_includes = {}
+        for inc_item in included_list:
+            head, _, tail = inc_item.partition(".")
+            if tail:
+                next_includes.setdefault(head, []).append(tail)
+
+        self_url = self._s_url
+        enable_relationships = get_config("ENABLE_RELATIONSHIPS")
+        big_query_threshold = get_config("BIG_QUERY_THRESHOLD")
 
         for rel_name, relationship in self._s_relationships.items():
             """
@@ -854,7 +1141,7 @@ class SAFRSBase(Model):
                 pass
             if rel_name in included_rels or safrs.SAFRS.INCLUDE_ALL in included_list:
                 # next_included_list contains the recursive relationship names
-                next_included_list = [inc_item.split(".")[1:] for inc_item in included_list if inc_item.startswith(rel_name + ".")]
+                next_included_list = next_includes.get(rel_name, [])
                 if relationship.direction == MANYTOONE:
                     # manytoone relationship contains a single instance
                     rel_item = getattr(self, rel_name)
@@ -867,7 +1154,7 @@ class SAFRSBase(Model):
                     data = []
                     rel_query = getattr(self, rel_name)
                     limit = request.get_page_limit(rel_name)
-                    if not get_config("ENABLE_RELATIONSHIPS"):
+                    if not enable_relationships:
                         meta["warning"] = "ENABLE_RELATIONSHIPS set to false in config.py"
                     elif rel_query:
                         # todo: check if lazy=dynamic
@@ -875,16 +1162,23 @@ class SAFRSBase(Model):
                         # you need to configure it with lazy='dynamic'
                         # "limit" may not be possible !
                         if getattr(rel_query, "limit", False):
-                            count = rel_query.count()
-                            rel_query = rel_query.limit(limit)
-                            if rel_query.count() >= get_config("BIG_QUERY_THRESHOLD"):
-                                warning = f'Truncated result for relationship "{rel_name}",consider paginating this request'
-                                safrs.log.warning(warning)
-                                meta["warning"] = warning
-                            items = rel_query.all()
+                            # fetch one extra row to detect truncation, so the
+                            # common (not truncated) case needs no COUNT query
+                            items = rel_query.limit(limit + 1).all()
+                            if len(items) > limit:
+                                items = items[:limit]
+                                count = rel_query.count()
+                                if count >= big_query_threshold:
+                                    warning = f'Truncated result for relationship "{rel_name}",consider paginating this request'
+                                    safrs.log.warning(warning)
+                                    meta["warning"] = warning
+                            else:
+                                count = len(items)
                         else:  # rel_query is an 'InstrumentedList'
-                            items = list(rel_query)[:limit]
-                            count = len(items)
+                            # the collection is already loaded in memory, stream
+                            # it through islice instead of copying it into a list
+                            count = min(len(rel_query), limit)
+                            items = islice(rel_query, limit)
                         meta["count"] = meta["total"] = count
                         meta["limit"] = limit
                         for rel_item in items:
@@ -893,11 +1187,7 @@ class SAFRSBase(Model):
                     # should never happen
                     safrs.log.error(f"Unknown relationship direction for relationship {rel_name}: {relationship.direction}")
 
-            rel_link = urljoin(self._s_url, rel_name)
-            links = dict(self=rel_link)
-            rel_data = dict(links=links)
-
-            rel_data["data"] = data
+            rel_data = {"links": {"self": urljoin(self_url, rel_name)}, "data": data}
             if meta:
                 rel_data["meta"] = meta
             relationships[rel_name] = rel_data
@@ -941,22 +1231,35 @@ class SAFRSBase(Model):
         """
         :return: a sample id for the API documentation
         """
+        sample_id = cls.__dict__.get("_s_sample_id_cached")
+        if sample_id is not None:
+            return sample_id
         sample = None
         if cls.query is None:
             return sample
         try:
+            # a real `LIMIT 1` query: only run it once per class, the swagger
+            # doc is inspected repeatedly and this fires for every exposed model
             sample = cls.query.first()
         except Exception as exc:
             safrs.log.debug(exc)
         if sample:
             try:
-                sample_id = sample.jsonapi_id
-                return sample_id
+                cls._s_sample_id_cached = sample.jsonapi_id
+                return cls._s_sample_id_cached
             except Exception:
                 safrs.log.warning(f"Failed to retrieve sample id for {cls}")
 
-        sample_id = cls.id_type.sample_id(cls)
-        return str(sample_id)  # jsonapi ids must always be strings
+        sample_id = str(cls.id_type.sample_id(cls))  # jsonapi ids must always be strings
+        cls._s_sample_id_cached = sample_id
+        return sample_id
+
+    @classmethod
+    def _s_invalidate_sample_id(cls):
+        """
+        Clear the cached swagger sample id, e.g. after seeding the database
+        """
+        cls._s_sample_id_cached = None
 
     @classmethod
     def _s_sample_dict(cls):
@@ -964,50 +1267,58 @@ class SAFRSBase(Model):
         :return: a sample to be used as an example "attributes" payload in the swagger example
         """
         # create a swagger example based on the jsonapi attributes (reflecting the database column schema)
-        sample = {}
-        for attr_name, attr in cls._s_jsonapi_attrs.items():
-            if is_jsonapi_attr(attr):
-                arg = getattr(attr, "default", "")
+        # the schema is static per class, so the column introspection only runs once
+        sample = cls.__dict__.get("_s_sample_dict_cached")
+        if sample is None:
+            sample = cls._s_sample_dict_cached = {attr_name: cls._s_sample_value(attr) for attr_name, attr in cls._s_jsonapi_attrs.items()}
+        return dict(sample)
+
+    @classmethod
+    def _s_sample_value(cls, attr):
+        """
+        :param attr: jsonapi attribute or column
+        :return: the sample value shown for `attr` in the swagger example
+        """
+        if is_jsonapi_attr(attr):
+            return getattr(attr, "default", "")
+
+        column = attr
+        arg = None
+        if hasattr(column, "sample"):
+            arg = getattr(column, "sample")
+        elif hasattr(column, "default") and column.default:
+            if callable(column.default.arg):
+                # We're not executing the default when it's a callable to avoid side-effects,
+                # user may add a sample attribute to the column to have it show up in the swagger
+                safrs.log.debug(f"No OAS sample implemented for column default '{column.name}.{column.default.arg}'")
+                arg = ""
+            elif isinstance(column.type, sqlalchemy.sql.sqltypes.JSON):
+                arg = column.default.arg
             else:
-                column = attr
-                arg = None
-                if hasattr(column, "sample"):
-                    arg = getattr(column, "sample")
-                elif hasattr(column, "default") and column.default:
-                    if callable(column.default.arg):
-                        # We're not executing the default when it's a callable to avoid side-effects,
-                        # user may add a sample attribute to the column to have it show up in the swagger
-                        safrs.log.debug(f"No OAS sample implemented for column default '{column.name}.{column.default.arg}'")
-                        arg = ""
-                    elif isinstance(column.type, sqlalchemy.sql.sqltypes.JSON):
-                        arg = column.default.arg
-                    else:
-                        python_type = SWAGGER2_TYPE_CAST.get(column.type, str)
-                        arg = python_type(column.default.arg)
+                python_type = SWAGGER2_TYPE_CAST.get(column.type, str)
+                arg = python_type(column.default.arg)
+        else:
+            # No default column value speciefd => infer one by type
+            try:
+                if column.type.python_type == int:
+                    arg = 0
+                if column.type.python_type == datetime.datetime:
+                    arg = str(datetime.datetime.min)
+                elif column.type.python_type == datetime.date:
+                    arg = str(datetime.datetime.min.date())
                 else:
-                    # No default column value speciefd => infer one by type
-                    try:
-                        if column.type.python_type == int:
-                            arg = 0
-                        if column.type.python_type == datetime.datetime:
-                            arg = str(datetime.datetime.min)
-                        elif column.type.python_type == datetime.date:
-                            arg = str(datetime.datetime.min.date())
-                        else:
-                            arg = column.type.python_type()
-                    except NotImplementedError:
-                        # This may happen for custom columns
-                        safrs.log.debug(f"Failed to get python type for column {column} (NotImplementedError)")
-                        arg = None
-                    except Exception as exc:
-                        safrs.log.debug(f"Failed to get python type for column {column} ({exc})")
-                        # use an empty string when no type is matched, otherwise we may get json encoding
-                        # errors for the swagger generation
-                        arg = ""
-
-            sample[attr_name] = arg
-
-        return sample
+                    arg = column.type.python_type()
+            except NotImplementedError:
+                # This may happen for custom columns
+                safrs.log.debug(f"Failed to get python type for column {column} (NotImplementedError)")
+                arg = None
+            except Exception as exc:
+                safrs.log.debug(f"Failed to get python type for column {column} ({exc})")
+                # use an empty string when no type is matched, otherwise we may get json encoding
+                # errors for the swagger generation
+                arg = ""
+
+        return arg
 
     @classproperty
     def _s_object_id(cls):
@@ -1024,18 +1335,31 @@ class SAFRSBase(Model):
         :return: a list of jsonapi_rpc methods for this class
         :rtype: list
         """
-        result = []
+        result = cls.__dict__.get("_s_rpc_methods_cached")
+        if result is not None:
+            return result
+        # Walk the class dicts instead of using inspect.getmembers: getmembers
+        # getattr's every member, executing descriptors (hybrid properties may
+        # even emit SQL) for each attribute on every call
+        method_names = []
+        seen = set()
+        for klass in cls.__mro__:
+            for name, member in vars(klass).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                if isinstance(member, (classmethod, staticmethod)):
+                    member = member.__func__
+                if callable(member) and get_doc(member) is not None:
+                    method_names.append(name)
+
         try:
-            cls_members = inspect.getmembers(cls)
-        except sqlalchemy.exc.InvalidRequestError as exc:
+            result = [getattr(cls, name) for name in sorted(method_names)]
+        except sqlalchemy.exc.InvalidRequestError as exc:  # pragma: no cover
             # This may happen if there's no sqlalchemy superclass
             safrs.log.warning(f"Member inspection failed for {cls}: {exc}")
-            return result
-
-        for _, method in cls_members:  # [(name, method),..]
-            rest_doc = get_doc(method)
-            if rest_doc is not None:
-                result.append(method)
+            return []
+        cls._s_rpc_methods_cached = result
         return result
 
     @classmethod
@@ -1050,10 +1374,7 @@ class SAFRSBase(Model):
         responses = {}
 
         if http_method.upper() in cls.http_methods:
-            responses = {HTTPStatus.NOT_FOUND.value: {"description": HTTPStatus.NOT_FOUND.description}}
-
-            if http_method in ("post"):
-                responses = {HTTPStatus.CREATED.value: {"description": HTTPStatus.CREATED.description}}
+            responses = dict(_SWAGGER_POST_RESPONSES if http_method == "post" else _SWAGGER_GET_RESPONSES)
 
         return body, responses
 
@@ -1081,9 +1402,20 @@ class SAFRSBase(Model):
         :return: endpoint url of this instance
         """
         try:
-            params = {self._s_object_id: self.jsonapi_id}
-            instance_url = url_for(self.get_endpoint(type="instance"), **params)
-            result = urljoin(self._s_url_root, instance_url)
+            # url_for walks the werkzeug url map, so only build the url once per
+            # class per request and substitute the instance id afterwards
+            cache = getattr(g, "_safrs_url_templates", None)
+            if cache is None:
+                cache = g._safrs_url_templates = {}
+            cls = self.__class__
+            template = cache.get(("instance", cls))
+            if template is None:
+                placeholder = "__safrs_id__"
+                instance_url = url_for(self.get_endpoint(type="instance"), **{self._s_object_id: placeholder})
+                template = cache[("instance", cls)] = instance_url.replace(placeholder, "{}")
+            # only the path is cached: the url root may differ between requests
+            # (ex. a Host-dependent _s_url_root), so join it at use time
+            result = urljoin(self._s_url_root, template.format(quote(str(self.jsonapi_id), safe="!$&'()*+,;=@:")))
         except RuntimeError:
             # This happens when creating the swagger doc and there is no application registered
             result = ""
@@ -1092,7 +1424,15 @@ class SAFRSBase(Model):
     @_s_url.expression
     def _s_url(cls, url_prefix=""):
         try:
-            collection_url = url_for(cls.get_endpoint())
+            # cached per class per request, like the instance url template above
+            cache = getattr(g, "_safrs_url_templates", None)
+            if cache is None:
+                cache = g._safrs_url_templates = {}
+            collection_url = cache.get(("collection", cls))
+            if collection_url is None:
+                collection_url = cache[("collection", cls)] = url_for(cls.get_endpoint())
+            # cfr. the instance url above: cache the path only, join the
+            # (possibly request-dependent) url root at use time
             result = urljoin(cls._s_url_root, collection_url)
         except RuntimeError:
             # This happens when creating the swagger doc and there is no application registered
@@ -1123,8 +1463,6 @@ class SAFRSBase(Model):
         """
         Type property setter, see comment in the type property
         """
-        if not self.Type == value:
-            self.Type = value
         self.type = value
 
     @classmethod
@@ -1157,6 +1495,7 @@ class SAFRSBase(Model):
 
         expressions = []
         query = cls._s_query
+        jsonapi_attrs = cls._s_jsonapi_attrs
 
         for filt in filters:
             if not isinstance(filt, dict):
@@ -1164,11 +1503,11 @@ class SAFRSBase(Model):
                 continue
             attr_name = filt.get("name")
             attr_val = filt.get("val")
-            if attr_name != "id" and attr_name not in cls._s_jsonapi_attrs:
+            if attr_name != "id" and attr_name not in jsonapi_attrs:
                 raise ValidationError(f'Invalid filter "{filt}", unknown attribute "{attr_name}"')
 
             op_name = filt.get("op", "").strip("_")
-            attr = cls._s_jsonapi_attrs[attr_name] if attr_name != "id" else cls.id
+            attr = jsonapi_attrs[attr_name] if attr_name != "id" else cls.id
             if op_name in ["in", "notin"]:
                 op = getattr(attr, op_name + "_")
                 query = query.filter(op(attr_val))
@@ -1176,22 +1515,39 @@ class SAFRSBase(Model):
                 # => attr is Column or InstrumentedAttribute
                 like = getattr(attr, op_name)
                 expressions.append(like(attr_val))
-            elif not hasattr(operator, op_name):
-                raise ValidationError(f'Invalid filter "{filt}", unknown operator "{op_name}"')
             else:
-                op = getattr(operator, op_name)
+                op = _FILTER_OPS.get(op_name)
+                if op is None:
+                    raise ValidationError(f'Invalid filter "{filt}", unknown operator "{op_name}"')
                 expressions.append(op(attr, attr_val))
 
         return query.filter(or_(*expressions))
 
 
+# pylint: disable=unused-argument
+@sqlalchemy.event.listens_for(sqlalchemy.orm.Mapper, "after_configured")
+def _build_safrs_class_caches():
+    """
+    Build the serialization lookup tables for all mapped SAFRSBase subclasses
+    once sqlalchemy has configured the mappers
+    (classes mapped afterwards build their caches lazily on first use)
+    """
+    subclasses = list(SAFRSBase.__subclasses__())
+    while subclasses:
+        subclass = subclasses.pop()
+        subclasses.extend(subclass.__subclasses__())
+        if hasattr(subclass, "__mapper__"):
+            subclass._s_build_class_caches()
+
+
 class Included:
     """
     This class is used to serialize instances that will be included in the jsonapi response
-    we keep a set of instances in `flask.g.ja_included` to avoid storing duplicates
+    `flask.g.ja_included` maps (jsonapi type, id) to the instance so duplicates are
+    deduplicated by key instead of relying on ORM instance hashing
     """
 
-    instance = None
+    __slots__ = ("instance", "included_list")
 
     def __init__(self, instance, included_list):
         """
@@ -1199,8 +1555,10 @@ class Included:
         :param included_list: the list of relationships that should be included for `instance` (from the url query param)
         """
         self.instance = instance
-        instance.included_list = [".".join(inc_rel) for inc_rel in included_list] if included_list else []
-        g.ja_included.add(instance)
+        # kept on the wrapper: mutating the ORM instance would trigger sqla
+        # attribute events for every included row
+        self.included_list = included_list or []
+        g.ja_included.setdefault((instance._s_type, str(instance.jsonapi_id)), self)
 
     @hybrid_method
     def encode(self):
@@ -1214,16 +1572,34 @@ class Included:
         """
         encoding of all included instances (in the included[] part of the jsonapi response)
         """
-        already_included = set()
+        # seed the seen keys with the primary data resources: those are already
+        # encoded at this point and may not appear in included[] again. Keys are
+        # (type, id) tuples, so the dedup never depends on ORM instance hashing
+        already_included = {(instance._s_type, str(instance.jsonapi_id)) for instance in g.ja_data}
         result = []
         while True:
-            instances = getattr(g, "ja_included", None)
-            if not instances:
+            included = getattr(g, "ja_included", None)
+            if not included:
                 break
-            instance = instances.pop()
-            if instance in already_included or instance in g.ja_data:
+            # take the current batch; serialization below may add new instances
+            # to g.ja_included for the recursive includes, picked up next round
+            batch = [(key, wrapper) for key, wrapper in included.items() if key not in already_included]
+            included.clear()
+            if not batch:
                 continue
-            included = instance._s_jsonapi_encode()
-            result.append(included)
+            if safrs.SAFRS.OPTIMIZED_LOADING:
+                # batch-load the relationships that will be traversed, grouped per
+                # class, instead of one lazy load per instance (N+1)
+                prefetch_groups = {}
+                for _, wrapper in batch:
+                    rel_names = {inc.split(".", 1)[0] for inc in wrapper.included_list if inc}
+                    if rel_names:
+                        instance = wrapper.instance
+                        prefetch_groups.setdefault((type(instance), frozenset(rel_names)), []).append(instance)
+                for (instance_cls, rel_names), group in prefetch_groups.items():
+                    instance_cls._s_prefetch(group, rel_names)
+            for key, wrapper in batch:
+                already_included.add(key)
+                result.append(wrapper.instance._s_jsonapi_encode(wrapper.included_list))
 
         return result
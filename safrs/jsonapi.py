@@ -275,6 +275,13 @@ class SAFRSRestAPI(Resource):
             instances = self.SAFRSObject._s_get()
             instances = jsonapi_sort(instances, self.SAFRSObject)
             links, data, count = paginate(instances, self.SAFRSObject)
+            if safrs.SAFRS.OPTIMIZED_LOADING and data:
+                # batch-load the included relationships for this page instead of
+                # lazy loading them per instance during serialization
+                included_csv = request.args.get("include", safrs.SAFRS.DEFAULT_INCLUDED)
+                included_rels = {inc.split(".")[0] for inc in included_csv.split(",") if inc}
+                if included_rels:
+                    self.SAFRSObject._s_prefetch(data, included_rels)
 
         # format the response: add the included objects
         result = jsonapi_format_response(data, meta, links, errors, count)
@@ -15,7 +15,7 @@ from werkzeug.datastructures import TypeConversionDict
 import safrs
 from .config import get_config
 from .errors import ValidationError
-from .safrs_api import HTTP_METHODS
+from .safrs_api import HTTP_METHODS_SET
 
 
 # pylint: disable=too-many-ancestors, logging-format-interpolation
@@ -129,7 +129,7 @@ class SAFRSRequest(Request):
             # raise GenericError('Unsupported Media Type', 415)
         if self.method == "OPTIONS":
             return None
-        if self.method not in HTTP_METHODS:
+        if self.method not in HTTP_METHODS_SET:
             abort(500)
         result = self.get_json()
         if not isinstance(result, dict):
@@ -4,7 +4,6 @@ import logging
 import werkzeug
 from flask_restful import abort, Resource
 from flask_restful.representations.json import output_json
-from flask_restful.utils import OrderedDict
 from flask_restful.utils import cors
 from flask_restful_swagger_2 import Api as FRSApiBase
 from flask_restful_swagger_2 import validate_definitions_object, parse_method_doc
@@ -20,14 +19,58 @@ from .config import get_config
 from .json_encoder import SAFRSJSONProvider, SAFRSJSONEncoder
 from ._safrs_relationship import SAFRSRelationshipObject
 from sqlalchemy.orm.interfaces import MANYTOONE
+import sqlalchemy
+import sqlalchemy.orm
 from flask import current_app, Response
 import json
+import re
 import yaml
 from flask.app import Flask
 from typing import Callable, Type
 
-HTTP_METHODS = ["GET", "POST", "PATCH", "DELETE", "PUT"]
-DEFAULT_REPRESENTATIONS = [("application/vnd.api+json", output_json)]
+HTTP_METHODS = ("GET", "POST", "PATCH", "DELETE", "PUT")
+HTTP_METHODS_SET = frozenset(HTTP_METHODS)
+HTTP_METHODS_LOWER = tuple(method.lower() for method in HTTP_METHODS)
+DEFAULT_REPRESENTATIONS = (("application/vnd.api+json", output_json),)
+
+# cors.crossdomain wrappers, shared across api classes (keyed by origin)
+_cors_wrappers = {}
+
+# characters stripped from operation summaries to form the operationId
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]")
+
+# memoized extract_swagger_path results: the flask url -> swagger url
+# conversion is pure and the same url may be registered multiple times
+_swagger_path_cache = {}
+
+
+def _method_not_allowed(*args, **kwargs):
+    """
+    Handler assigned to the http methods that were not enabled on the SAFRSObject
+    """
+    return {}, HTTPStatus.METHOD_NOT_ALLOWED
+
+
+def _no_swagger_decorator(fun: Callable) -> Callable:
+    """
+    swagger_doc replacement used when no swagger ui is exposed: leave the method as-is
+    """
+    return fun
+
+
+def _clone_operation(operation: dict) -> dict:
+    """
+    Copy a swagger operation dict so the per-url customization can mutate it.
+    Only the slots that are actually mutated (summary, operationId, parameters
+    and the responses subtree) need copying, which is much cheaper than
+    running copy.deepcopy over the whole operation
+    :param operation: swagger operation dict
+    :return: copied operation
+    """
+    clone = operation.copy()
+    clone["parameters"] = list(operation.get("parameters", []))
+    clone["responses"] = {status: response.copy() for status, response in operation.get("responses", {}).items()}
+    return clone
 
 
 class SAFRSAPI(FRSApiBase):
@@ -40,6 +83,10 @@ class SAFRSAPI(FRSApiBase):
     _operation_ids = {}
     _custom_swagger = {}
     _als_resources = []
+    # Cache of the extracted (path_item, definitions) tuples per resource class:
+    # the same resource may be registered for multiple urls (e.g. relationships),
+    # caching avoids re-extracting the swagger operations every time
+    _resource_swagger_cache = {}
     client_uri = ""
 
     def __init__(
@@ -68,9 +115,29 @@ class SAFRSAPI(FRSApiBase):
 
         self._custom_swagger = kwargs.pop("custom_swagger", {})
         self.swaggerui_blueprint = swaggerui_blueprint
+        # Swagger path generation is deferred until the spec is requested for the
+        # first time: the (expensive) per-resource builders are queued here by
+        # `add_resource` and drained by `get_swagger_doc`
+        self._deferred_swagger = []
+        # The builders accumulate paths and definitions here, the staged dicts
+        # are merged into self._swagger_object once, by `finalize_swagger`
+        self._staged_paths = {}
+        self._staged_definitions = {}
         kwargs["default_mediatype"] = "application/vnd.api+json"
         app_db = kwargs.pop("app_db", None)
         safrs.SAFRS(app, app_db=app_db, prefix=prefix, json_encoder=json_encoder, swaggerui_blueprint=swaggerui_blueprint, **kwargs)
+        # Resolve the configurable url & endpoint formatters once: these don't
+        # change at runtime but are needed for every exposed object, method and
+        # relationship. This must run after safrs.SAFRS() above, which copies
+        # app.config onto the SAFRS config class that get_config falls back to
+        # when there's no app context
+        self._resource_url_fmt = get_config("RESOURCE_URL_FMT")
+        self._instance_url_fmt = get_config("INSTANCE_URL_FMT")
+        self._classmethod_url_fmt = get_config("CLASSMETHOD_URL_FMT")
+        self._instancemethod_url_fmt = get_config("INSTANCEMETHOD_URL_FMT")
+        self._endpoint_fmt = get_config("ENDPOINT_FMT")
+        self._relationship_url_fmt = get_config("RELATIONSHIP_URL_FMT")
+        self._object_id_suffix = get_config("OBJECT_ID_SUFFIX")
         # the host shown in the swagger ui
         # this host may be different from the hostname of the server and
         # sometimes we don't want to show the port (eg when proxied)
@@ -90,16 +157,72 @@ class SAFRSAPI(FRSApiBase):
         app.json = SAFRSJSONProvider(app)
         app.json_encoder = SAFRSJSONEncoder  # deprecated, but used by the swaggerui blueprint
         self.init_app(app)
-        self.representations = OrderedDict(DEFAULT_REPRESENTATIONS)
+        self.representations = dict(DEFAULT_REPRESENTATIONS)
         self.update_spec()
+        # The spec view created by flask_restful_swagger_2 serves self._swagger_object,
+        # wrap it so the deferred swagger generation runs before the spec is served.
+        # The serialized spec is cached: the spec only changes when new resources
+        # are exposed (i.e. when builders are queued), so subsequent requests can
+        # be answered with the cached bytes instead of re-serializing the spec
+        self._swagger_response = None
+        spec_view = app.view_functions.get("swagger")
+        if spec_view is not None:
+
+            @wraps(spec_view)
+            def swagger_spec_view(*args, **view_kwargs):
+                if self._deferred_swagger:
+                    self._build_swagger()
+                    self._swagger_response = None
+                if self._swagger_response is None:
+                    response = spec_view(*args, **view_kwargs)
+                    self._swagger_response = (response.get_data(), response.content_type)
+                body, content_type = self._swagger_response
+                return Response(body, content_type=content_type)
+
+            app.view_functions["swagger"] = swagger_spec_view
         SAFRSAPI.client_uri = host
 
     def update_spec(self) -> None:
         """
         :param custom_swagger: swagger spec to be added to the swagger.json
         """
-        _swagger_doc = self.get_swagger_doc()
-        safrs.dict_merge(_swagger_doc, self._custom_swagger)
+        safrs.dict_merge(self._swagger_object, self._custom_swagger)
+
+    def get_swagger_doc(self):
+        """
+        :return: the swagger spec; runs the deferred swagger generation first
+        """
+        self._build_swagger()
+        return self._swagger_object
+
+    def _build_swagger(self) -> None:
+        """
+        Drain the queued per-resource swagger builders (populated by `add_resource`
+        and `expose_object`), generating the spec paths, tags and definitions
+        """
+        if not self._deferred_swagger:
+            return
+        while self._deferred_swagger:
+            build = self._deferred_swagger.pop(0)
+            build()
+        self.finalize_swagger()
+
+    def finalize_swagger(self) -> None:
+        """
+        Merge the staged paths and definitions into the swagger spec in one batch
+        """
+        self._swagger_object["paths"].update(self._staged_paths)
+        self._swagger_object["definitions"].update(self._staged_definitions)
+        self._staged_paths = {}
+        self._staged_definitions = {}
+        # re-apply the user-provided custom_swagger: the staged paths were
+        # generated before it was merged and must not clobber its overrides
+        self.update_spec()
+        # Check whether we manage to convert to json
+        try:
+            json.dumps(self._swagger_object)
+        except Exception:  # pragma: no cover
+            safrs.log.critical("Json encoding failed")
 
     def expose_object(self, safrs_object, url_prefix="", **properties):
         """This methods creates the API url endpoints for the SAFRObjects
@@ -121,6 +244,10 @@ class SAFRSAPI(FRSApiBase):
         if not current_app:
             safrs.log.error("Working outside of app context!")
         rest_api = safrs_object._rest_api  # => SAFRSRestAPI
+        # Bind the classproperties to locals: each access goes through the
+        # descriptor protocol and they're needed several times here
+        collection_name = safrs_object._s_collection_name
+        object_type = safrs_object._s_type
 
         properties["SAFRSObject"] = safrs_object
         properties["http_methods"] = safrs_object.http_methods
@@ -128,40 +255,48 @@ class SAFRSAPI(FRSApiBase):
         endpoint = safrs_object.get_endpoint()
 
         # tags indicate where in the swagger hierarchy the endpoint will be shown
-        tags = [safrs_object._s_collection_name]
+        tags = [collection_name]
 
         # Expose the methods first
         self.expose_methods(url_prefix, tags, safrs_object, properties)
 
         # Expose the collection: Create the class and decorate it
-        api_class_name = f"{safrs_object._s_type}_API"  # name for dynamically generated classes
-        RESOURCE_URL_FMT = get_config("RESOURCE_URL_FMT")  # configurable resource collection url formatter
-        url = RESOURCE_URL_FMT.format(url_prefix, safrs_object._s_collection_name)
-        swagger_decorator = swagger_doc(safrs_object) if self.swaggerui_blueprint else lambda x : x
+        api_class_name = f"{object_type}_API"  # name for dynamically generated classes
+        url = self._resource_url_fmt.format(url_prefix, collection_name)
+        swagger_decorator = swagger_doc(safrs_object) if self.swaggerui_blueprint else _no_swagger_decorator
         api_class = api_decorator(type(api_class_name, (rest_api,), properties), swagger_decorator)
 
-        safrs.log.info(f"Exposing {safrs_object._s_collection_name} on {url}, endpoint: {endpoint}")
+        safrs.log.info(f"Exposing {collection_name} on {url}, endpoint: {endpoint}")
         self.add_resource(api_class, url, endpoint=endpoint, methods=["GET", "POST"])
 
-        INSTANCE_URL_FMT = get_config("INSTANCE_URL_FMT")
-        url = INSTANCE_URL_FMT.format(url_prefix, safrs_object._s_collection_name, safrs_object.__name__)
+        url = self._instance_url_fmt.format(url_prefix, collection_name, safrs_object.__name__)
         endpoint = safrs_object.get_endpoint(type="instance")
 
         # Expose the instances
-        safrs.log.info(f"Exposing {safrs_object._s_type} instances on {url}, endpoint: {endpoint}")
+        safrs.log.info(f"Exposing {object_type} instances on {url}, endpoint: {endpoint}")
         api_class = api_decorator(type(api_class_name + "_i", (rest_api,), properties), swagger_decorator)
         self.add_resource(api_class, url, endpoint=endpoint, methods=["GET", "PATCH", "DELETE"])
 
-        object_doc = parse_object_doc(safrs_object)
-        object_doc["name"] = safrs_object._s_collection_name
-        self._swagger_object["tags"].append(object_doc)
+        self._deferred_swagger.append(lambda: self._build_object_doc(safrs_object))
 
         for relationship in safrs_object._s_relationships.values():
             self.expose_relationship(relationship, url, tags, properties)
 
+        self.update_spec()
+        self._als_resources.append(safrs_object)
+
+    def _build_object_doc(self, safrs_object) -> None:
+        """
+        Add the object documentation to the swagger "tags" and the schema references
+        to the swagger "definitions" (deferred part of `expose_object`)
+        """
+        object_doc = parse_object_doc(safrs_object)
+        object_doc["name"] = safrs_object._s_collection_name
+        self._swagger_object["tags"].append(object_doc)
+
         # add newly created schema references to the "definitions"
         for def_name, definition in Schema._references.items():
-            if self._swagger_object["definitions"].get(def_name):
+            if def_name in self._swagger_object["definitions"] or def_name in self._staged_definitions:
                 continue
             try:
                 validate_definitions_object(definition.properties)
@@ -170,9 +305,6 @@ class SAFRSAPI(FRSApiBase):
                 continue
             self._swagger_object["definitions"][def_name] = {"properties": definition.properties}
 
-        self.update_spec()
-        self._als_resources.append(safrs_object)
-
     def expose(self, *safrs_objects, url_prefix="", **properties):
         """
         Expose multiple objects at once
@@ -189,27 +321,28 @@ class SAFRSAPI(FRSApiBase):
         """
         rpc_api = safrs_object._rpc_api  # => SAFRSJSONRPCAPI
         api_methods = safrs_object._s_get_jsonapi_rpc_methods()
+        # Bind the classproperties to locals, they're reused for every rpc method
+        collection_name = safrs_object._s_collection_name
+        class_name = safrs_object._s_class_name
+        http_methods = safrs_object.http_methods
         for api_method in api_methods:
             method_name = api_method.__name__
-            api_method_class_name = f"method_{safrs_object._s_class_name}_{method_name}"
+            api_method_class_name = f"method_{class_name}_{method_name}"
             if (
                 isinstance(safrs_object.__dict__.get(method_name, None), (classmethod, staticmethod))
                 or getattr(api_method, "__self__", None) is safrs_object
             ):
                 # method is a classmethod or static method, make it available at the class level
-                CLASSMETHOD_URL_FMT = get_config("CLASSMETHOD_URL_FMT")
-                url = CLASSMETHOD_URL_FMT.format(url_prefix, safrs_object._s_collection_name, method_name)
+                url = self._classmethod_url_fmt.format(url_prefix, collection_name, method_name)
             else:
                 # expose the method at the instance level
-                INSTANCEMETHOD_URL_FMT = get_config("INSTANCEMETHOD_URL_FMT")
-                url = INSTANCEMETHOD_URL_FMT.format(url_prefix, safrs_object._s_collection_name, safrs_object._s_object_id, method_name)
+                url = self._instancemethod_url_fmt.format(url_prefix, collection_name, safrs_object._s_object_id, method_name)
 
-            ENDPOINT_FMT = get_config("ENDPOINT_FMT")
-            endpoint = ENDPOINT_FMT.format(url_prefix, safrs_object._s_collection_name + "." + method_name)
+            endpoint = self._endpoint_fmt.format(url_prefix, collection_name + "." + method_name)
             swagger_decorator = swagger_method_doc(safrs_object, method_name, tags)
-            properties.update({"method_name": method_name, "http_methods": safrs_object.http_methods})
+            properties.update({"method_name": method_name, "http_methods": http_methods})
             api_class = api_decorator(type(api_method_class_name, (rpc_api,), properties), swagger_decorator)
-            meth_name = safrs_object._s_class_name + "." + api_method.__name__
+            meth_name = class_name + "." + method_name
             safrs.log.info(f"Exposing method {meth_name} on {url}, endpoint: {endpoint}")
             self.add_resource(api_class, url, endpoint=endpoint, methods=get_http_methods(api_method), jsonapi_rpc=True)
 
@@ -240,25 +373,22 @@ class SAFRSAPI(FRSApiBase):
             safrs.log.debug(f"Not exposing {target_object}")
             return
 
-        API_CLASSNAME_FMT = "{}_X_{}_API"  # api class name for generated relationship classes
         rel_name = relationship.key
         parent_class = relationship.parent.class_
         parent_name = parent_class.__name__
 
         # Name of the endpoint class
-        RELATIONSHIP_URL_FMT = get_config("RELATIONSHIP_URL_FMT")
-        api_class_name = API_CLASSNAME_FMT.format(parent_name, rel_name)
-        url = RELATIONSHIP_URL_FMT.format(url_prefix, rel_name)
+        api_class_name = f"{parent_name}_X_{rel_name}_API"  # api class name for generated relationship classes
+        url = self._relationship_url_fmt.format(url_prefix, rel_name)
 
-        ENDPOINT_FMT = get_config("ENDPOINT_FMT")
-        endpoint = ENDPOINT_FMT.format(url_prefix, rel_name)
+        endpoint = self._endpoint_fmt.format(url_prefix, rel_name)
 
         # Relationship object
-        decorators = set(
-            getattr(parent_class, "custom_decorators", [])
-            + getattr(parent_class, "decorators", [])
-            + getattr(relationship, "decorators", [])
-        )
+        decorators = {
+            *getattr(parent_class, "custom_decorators", ()),
+            *getattr(parent_class, "decorators", ()),
+            *getattr(relationship, "decorators", ()),
+        }
         rel_object = type(
             f"{parent_name}.{rel_name}",  # Name of the class we're creating here
             (SAFRSRelationshipObject,),
@@ -270,6 +400,11 @@ class SAFRSAPI(FRSApiBase):
                 "custom_decorators": list(decorators),
                 "parent": parent_class,
                 "_target": target_object,
+                # Materialized here so lookups don't go through the classproperty
+                # descriptors on SAFRSRelationshipObject for values that are
+                # already known at class-creation time
+                "_s_type": target_object._s_type,
+                "_s_class_name": target_object.__name__,
             },
         )
 
@@ -302,7 +437,7 @@ class SAFRSAPI(FRSApiBase):
         # query and delete the class relationship properties for a given
         # target id
         # nb: this is not really documented in the jsonapi spec, remove??
-        url = (RELATIONSHIP_URL_FMT + "/<string:{}>").format(url_prefix, rel_name, target_object_id)
+        url = (self._relationship_url_fmt + "/<string:{}>").format(url_prefix, rel_name, target_object_id)
         endpoint = f"{url_prefix}api.{rel_name}Id"
 
         safrs.log.info(f"Exposing {parent_name} relationship {rel_name} on {url}, endpoint: {endpoint}")
@@ -318,13 +453,21 @@ class SAFRSAPI(FRSApiBase):
         in the order specified by ordered_methods
         """
         if ordered_methods is None:
-            ordered_methods = HTTP_METHODS
-        om = ordered_methods
+            # Memoize the result for the default ordering on the resource class:
+            # this is called several times per url registration
+            resource_methods = resource.__dict__.get("_safrs_resource_methods")
+            if resource_methods is None:
+                resource_methods = SAFRSAPI.get_resource_methods(resource, HTTP_METHODS)
+                resource._safrs_resource_methods = resource_methods
+            return resource_methods
+
+        om = frozenset(ordered_methods)
         safrs_object = getattr(resource, "SAFRSObject", None)
         if safrs_object:
-            om = [m.upper() for m in safrs_object.http_methods if m.upper() in ordered_methods]
+            om = frozenset(m.upper() for m in safrs_object.http_methods) & om
 
-        resource_methods = [m.lower() for m in ordered_methods if m in resource.methods and m.upper() in om]
+        declared_methods = frozenset(resource.methods)
+        resource_methods = tuple(m.lower() for m in ordered_methods if m in declared_methods and m.upper() in om)
         return resource_methods
 
     def add_resource(self, resource, *urls, **kwargs):
@@ -333,45 +476,70 @@ class SAFRSAPI(FRSApiBase):
 
         Changed because we don't need path id examples when there's no {id} in the path.
         We also have to filter out the unwanted parameters
+
+        The flask routes are registered immediately, the swagger path generation
+        is queued and runs when the spec is first requested (cfr. `_build_swagger`)
         """
         relationship = kwargs.pop("relationship", False)  # relationship object
-        SAFRS_INSTANCE_SUFFIX = get_config("OBJECT_ID_SUFFIX") + "}"
+        is_jsonapi_rpc = kwargs.pop("jsonapi_rpc", False)  # check if the exposed method is a jsonapi_rpc method
+        deprecated = kwargs.pop("deprecated", False)  # deprecated functionality: still working but not shown in swagger
+        methods = kwargs.get("methods", None)
+
+        if not deprecated:
+            # deprecated urls stay routable but produce no swagger, so there is
+            # nothing to build for them
+            self._deferred_swagger.append(
+                lambda: self._build_resource_swagger(resource, urls, methods, relationship, is_jsonapi_rpc)
+            )
+
+        # disable API methods that were not set by the SAFRSObject
+        resource_methods = frozenset(self.get_resource_methods(resource))
+        for hm in HTTP_METHODS_LOWER:
+            if hm not in resource_methods:
+                setattr(resource, hm, _method_not_allowed)
+        # pylint: disable=bad-super-call
+        super(FRSApiBase, self).add_resource(resource, *urls, **kwargs)
+
+    def _build_resource_swagger(self, resource, urls, methods, relationship, is_jsonapi_rpc) -> None:
+        """
+        Build the swagger path items for the resource urls
+        (deferred part of `add_resource`)
+        """
+        SAFRS_INSTANCE_SUFFIX = self._object_id_suffix + "}"
+        resource_methods = self.get_resource_methods(resource)
 
         path_item = {}
         self._add_oas_resource_definitions(resource, path_item)
-        is_jsonapi_rpc = kwargs.pop("jsonapi_rpc", False)  # check if the exposed method is a jsonapi_rpc method
-        deprecated = kwargs.pop("deprecated", False)  # deprecated functionality: still working but not shown in swagger
 
         # this loop builds the swagger for the specified url(s) by adding it to
         # self._swagger_object["paths"][swagger_url], so if the loop continues,
         # there will be no swagger
         # usually there will only be one url, but flask_restful add_resource does support multiple urls
         for url in urls:
-            if deprecated:
-                # functionality still works, but there will be no swagger
-                continue
             if not url.startswith("/"):  # pragma: no cover
                 raise SystemValidationError("paths must start with a /")
 
-            swagger_url = extract_swagger_path(url)
-            # exposing_instance tells us whether we're exposing an instance (as opposed to a collection)
-            exposing_instance = swagger_url.strip("/").endswith(SAFRS_INSTANCE_SUFFIX)
+            cached_path = _swagger_path_cache.get((url, SAFRS_INSTANCE_SUFFIX))
+            if cached_path is None:
+                swagger_url = extract_swagger_path(url)
+                # exposing_instance tells us whether we're exposing an instance (as opposed to a collection)
+                exposing_instance = swagger_url.strip("/").endswith(SAFRS_INSTANCE_SUFFIX)
+                cached_path = _swagger_path_cache[(url, SAFRS_INSTANCE_SUFFIX)] = (swagger_url, exposing_instance)
+            swagger_url, exposing_instance = cached_path
             if relationship:
                 exposing_instance = relationship.direction == MANYTOONE
-            for method in self.get_resource_methods(resource):
-                if kwargs.get("methods", None) and method.upper() not in [m.upper() for m in kwargs.get("methods", [])]:
+            if exposing_instance:
+                # POSTing to an instance isn't jsonapi-compliant (https://jsonapi.org/format/#crud-creating-client-ids)
+                # "A server MUST return 403 Forbidden in response to an
+                # unsupported request to create a resource with a client-generated ID"
+                path_item.pop("post", None)
+            allowed_methods = frozenset(m.upper() for m in methods) if methods else None
+            for method in resource_methods:
+                if allowed_methods and method.upper() not in allowed_methods:
                     # only use the
                     path_item.pop(method, None)
                     continue
 
-                if method == "post" and exposing_instance:
-                    # POSTing to an instance isn't jsonapi-compliant (https://jsonapi.org/format/#crud-creating-client-ids)
-                    # "A server MUST return 403 Forbidden in response to an
-                    # unsupported request to create a resource with a client-generated ID"
-                    # the method has already been added before, remove it & continue
-                    path_item.pop(method, None)
-                    continue
-
                 method_doc = path_item.get(method)
                 if not method_doc:
                     continue
@@ -384,8 +552,15 @@ class SAFRSAPI(FRSApiBase):
                 method_doc["operationId"] = self._get_operation_id(path_item.get(method).get("summary", ""))
 
                 self._add_oas_req_params(resource, path_item, method, exposing_instance, is_jsonapi_rpc, swagger_url)
-                self._add_oas_references(resource.SAFRSObject, path_item, method, exposing_instance, relationship)
-
+                if not is_jsonapi_rpc:
+                    # rpc methods return {"meta": ...}, not a jsonapi document:
+                    # the instance/collection schema references don't apply
+                    self._add_oas_references(resource.SAFRSObject, path_item, method, exposing_instance, relationship)
+
+            # path_item only grows in the loop above, so validating the final
+            # version once per url is sufficient (can be disabled with the
+            # VALIDATE_SWAGGER config setting)
+            if get_config("VALIDATE_SWAGGER"):
                 try:  # pragma: no cover
                     validate_path_item_object(path_item)
                 except FRSValidationError as exc:
@@ -393,56 +568,46 @@ class SAFRSAPI(FRSApiBase):
                     safrs.log.critical(f"Validation failed for {path_item}")
                     exit(1)
 
-            self._swagger_object["paths"][swagger_url] = path_item
-            # Check whether we manage to convert to json
-            try:
-                json.dumps(self._swagger_object)
-            except Exception:  # pragma: no cover
-                safrs.log.critical("Json encoding failed")
-
-        # disable API methods that were not set by the SAFRSObject
-        for http_method in HTTP_METHODS:
-            hm = http_method.lower()
-            if hm not in self.get_resource_methods(resource):
-                setattr(resource, hm, lambda x: ({}, HTTPStatus.METHOD_NOT_ALLOWED))
-        # pylint: disable=bad-super-call
-        super(FRSApiBase, self).add_resource(resource, *urls, **kwargs)
+            self._staged_paths[swagger_url] = path_item
 
     def _add_oas_req_params(self, resource, path_item, method, exposing_instance, is_jsonapi_rpc, swagger_url):
         """
         Add the request parameters to the swagger (filter, sort)
         """
         method_doc = path_item[method]
-        parameters = []
-        for parameter in method_doc.get("parameters", []):
-            object_id = "{%s}" % parameter.get("name")
-            if method == "get":
-                # Get the jsonapi included resources, ie the exposed relationships
-                param = resource.get_swagger_include()
-                parameters.append(param)
-
-                # Get the jsonapi fields[], ie the exposed attributes/columns
-                # only required for collections though
-                param = resource.get_swagger_fields()
-                parameters.append(param)
+        parameters = method_doc.get("parameters", [])
+        unique_params = {}  # deduplicate parameters by name, in a single pass
+
+        # The generated jsonapi parameters don't depend on the declared operation
+        # parameters: build them once, before the loop
+        if parameters and method == "get":
+            # Get the jsonapi included resources, ie the exposed relationships
+            param = resource.get_swagger_include()
+            unique_params.setdefault(param["name"], param)
+
+            # Get the jsonapi fields[], ie the exposed attributes/columns
+            # only required for collections though
+            param = resource.get_swagger_fields()
+            unique_params.setdefault(param["name"], param)
 
             #
             # Add the sort, filter parameters to the swagger doc when retrieving a collection
             #
-            if method == "get" and not (exposing_instance or is_jsonapi_rpc):
+            if not (exposing_instance or is_jsonapi_rpc):
                 # limit parameter specifies the number of items to return
-                parameters += default_paging_parameters()
+                for param in default_paging_parameters():
+                    unique_params.setdefault(param["name"], param)
                 param = resource.get_swagger_sort()
-                parameters.append(param)
-                parameters += list(resource.get_swagger_filters())
+                unique_params.setdefault(param["name"], param)
+                for param in resource.get_swagger_filters():
+                    unique_params.setdefault(param["name"], param)
 
-            if not (parameter.get("in") == "path" and object_id not in swagger_url) and parameter not in parameters:
+        for parameter in parameters:
+            object_id = "{" + parameter.get("name", "") + "}"
+            if not (parameter.get("in") == "path" and object_id not in swagger_url):
                 # Only if a path param is in path url then we add the param
-                parameters.append(parameter)
+                unique_params.setdefault(parameter["name"], parameter)
 
-        unique_params = OrderedDict()  # rm duplicates
-        for param in parameters:
-            unique_params[param["name"]] = param
         method_doc["parameters"] = list(unique_params.values())
         path_item[method] = method_doc
 
@@ -498,10 +663,19 @@ class SAFRSAPI(FRSApiBase):
         :param resource:
         :param path_item:
         """
+        resource_methods = self.get_resource_methods(resource)
+        cache_key = (id(resource), tuple(sorted(resource_methods)))
+        cached = self._resource_swagger_cache.get(cache_key)
+        if cached is not None:
+            path_item_base, definitions = cached
+            path_item.update({method: _clone_operation(operation) for method, operation in path_item_base.items()})
+            self._staged_definitions.update(definitions)
+            return
+
         definitions = {}
 
-        for method in self.get_resource_methods(resource):
-            if not method.upper() in HTTP_METHODS:
+        for method in resource_methods:
+            if method.upper() not in HTTP_METHODS_SET:
                 continue
             f = getattr(resource, method, None)
             if not f:
@@ -516,24 +690,26 @@ class SAFRSAPI(FRSApiBase):
                 if summary:
                     operation["summary"] = summary.split("<br/>")[0]
 
-        try:
-            validate_definitions_object(definitions)
-        except FRSValidationError:
-            safrs.log.critical(f"Validation failed for {definitions}")
-            exit()
-
-        self._swagger_object["definitions"].update(definitions)
+        if get_config("VALIDATE_SWAGGER"):
+            try:
+                validate_definitions_object(definitions)
+            except FRSValidationError:
+                safrs.log.critical(f"Validation failed for {definitions}")
+                exit()
+
+        self._resource_swagger_cache[cache_key] = (
+            {method: _clone_operation(operation) for method, operation in path_item.items()},
+            definitions,
+        )
+        self._staged_definitions.update(definitions)
 
     @classmethod
     def _get_operation_id(cls, summary: str) -> str:
         """
         :param summary:
         """
-        summary = "".join(c for c in summary if c.isalnum())
-        if summary not in cls._operation_ids:
-            cls._operation_ids[summary] = 0
-        else:
-            cls._operation_ids[summary] += 1
+        summary = _NON_ALNUM_RE.sub("", summary)
+        cls._operation_ids[summary] = cls._operation_ids.get(summary, -1) + 1
         return f"{summary}_{cls._operation_ids[summary]}"
 
     def expose_als_schema(self, api_root="/api", schema_loc="/als_schema"):
@@ -589,7 +765,17 @@ def api_decorator(cls, swagger_decorator):
     """
 
     cors_domain = get_config("cors_domain")
+    cors_wrap = None
+    if cors_domain is not None:
+        # the crossdomain decorator only depends on the origin:
+        # build it once per domain and share it between all api classes
+        cors_wrap = _cors_wrappers.get(cors_domain)
+        if cors_wrap is None:
+            cors_wrap = _cors_wrappers[cors_domain] = cors.crossdomain(origin=cors_domain)
     cls.http_methods = {}  # holds overridden http methods, note: cls also has "methods" set, but it's not related to this
+    # The user can add custom decorators, specified as class variable list
+    # the set is built once here instead of once per http method
+    custom_decorators = {*getattr(cls.SAFRSObject, "custom_decorators", ()), *getattr(cls.SAFRSObject, "decorators", ())}
     for method_name in [
         "patch",
         "post",
@@ -613,8 +799,8 @@ def api_decorator(cls, swagger_decorator):
             cls.http_methods[method_name] = parent_method
 
         # Add cors
-        if cors_domain is not None:
-            decorated_method = cors.crossdomain(origin=cors_domain)(decorated_method)
+        if cors_wrap is not None:
+            decorated_method = cors_wrap(decorated_method)
         # Add exception handling
         decorated_method = http_method_decorator(decorated_method)
         setattr(decorated_method, "SAFRSObject", cls.SAFRSObject)
@@ -631,9 +817,8 @@ def api_decorator(cls, swagger_decorator):
                 safrs.log.exception(exc)
                 safrs.log.error(f"Failed to generate documentation for {decorated_method}")
 
-            # The user can add custom decorators
-            # Apply the custom decorators, specified as class variable list
-            for custom_decorator in set(getattr(cls.SAFRSObject, "custom_decorators", []) + getattr(cls.SAFRSObject, "decorators", [])):
+            # Apply the custom decorators
+            for custom_decorator in custom_decorators:
                 # update_wrapper(custom_decorator, decorated_method)
                 swagger_operation_object = getattr(decorated_method, "__swagger_operation_object", {})
                 decorated_method = custom_decorator(decorated_method)
@@ -643,6 +828,22 @@ def api_decorator(cls, swagger_decorator):
     return cls
 
 
+@sqlalchemy.event.listens_for(sqlalchemy.orm.Session, "after_flush")
+def _mark_session_flushed(session, flush_context):
+    """Remember that a flush moved writes into the open transaction:
+    flushing empties session.new/dirty/deleted, so `method_wrapper` can't
+    rely on those collections alone to decide whether a commit is needed
+    """
+    session.info["safrs_flushed"] = True
+
+
+@sqlalchemy.event.listens_for(sqlalchemy.orm.Session, "after_commit")
+@sqlalchemy.event.listens_for(sqlalchemy.orm.Session, "after_rollback")
+def _clear_session_flushed(session):
+    """The transaction ended, reset the flush marker set above"""
+    session.info.pop("safrs_flushed", None)
+
+
 def http_method_decorator(fun: Callable) -> Callable:
     """Decorator for the supported jsonapi HTTP methods (get, post, patch, delete)
     - commit the database
@@ -668,7 +869,22 @@ def http_method_decorator(fun: Callable) -> Callable:
                 # reuire jsonapi content type for requests to these routes
                 raise GenericError(HTTPStatus.UNSUPPORTED_MEDIA_TYPE.description, HTTPStatus.UNSUPPORTED_MEDIA_TYPE.value)
             result = fun(*args, **kwargs)
-            safrs.DB.session.commit()
+            session = safrs.DB.session
+            if (
+                session.new
+                or session.dirty
+                or session.deleted
+                or session.info.get("safrs_flushed")
+                or get_config("AUTOCOMMIT_READS")
+            ):
+                # only issue a commit round-trip when there are pending or
+                # already-flushed writes: autoflush EMPTIES new/dirty/deleted
+                # by moving the changes into the open transaction, hence the
+                # "safrs_flushed" marker set by the after_flush event above.
+                # AUTOCOMMIT_READS restores the old commit-on-every-request behavior
+                session.commit()
+            else:
+                session.rollback()
             return result
 
         except werkzeug.exceptions.NotFound as exc:
@@ -689,10 +905,7 @@ def http_method_decorator(fun: Callable) -> Callable:
         except Exception as exc:
             safrs.log.exception(exc)
             safrs_exception = exc
-            if safrs.log.getEffectiveLevel() > logging.DEBUG:
-                safrs_exception.message = "Logging Disabled"
-            else:
-                safrs_exception.message = str(exc)
+            safrs_exception.message = str(exc) if safrs.log.isEnabledFor(logging.DEBUG) else "Logging Disabled"
 
         status_code = getattr(safrs_exception, "status_code", status_code)
         api_code = getattr(safrs_exception, "api_code", status_code)
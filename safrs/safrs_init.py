@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import sys
@@ -37,6 +38,9 @@ class SAFRS:
     RELATIONSHIP_URL_FMT = None
     ENDPOINT_FMT = None
     MAX_TABLE_COUNT = 10**7  # table counts will become really slow for large tables, inform the user about it using this
+    VALIDATE_SWAGGER = True  # validate the generated swagger spec, can be disabled in production to speed up startup
+    BATCH_COMMITS = False  # defer `_s_post` commits to a single commit at the end of the request
+    AUTOCOMMIT_READS = False  # set to True to commit after every request, even when nothing was written
     INCLUDE_ALL = "+all"  # include= url query argument that tells us to include all related resources
     #
     config = {}
@@ -100,9 +104,32 @@ class SAFRS:
         @app.before_request
         def init_ja_data():
             # ja_data holds all data[] instances that will be encoded
-            # ja_included holds all included instances
+            # ja_included maps (jsonapi type, id) to the included instances
             g.ja_data = set()
-            g.ja_included = set()
+            g.ja_included = {}
+            # reset the per-request lazy caches: `g` lives on the app context,
+            # which outlives the request when an outer context is pushed
+            # (test clients, `app.run()` inside `with app.app_context()`)
+            g._safrs_include_args = None
+            g._safrs_pk_cache = None
+            g._safrs_url_templates = None
+
+        @app.after_request
+        def flush_pending_commits(response):
+            # commit the instances scheduled by `_s_post` when BATCH_COMMITS is enabled
+            if getattr(g, "_safrs_pending", None):
+                g._safrs_pending = []
+                try:
+                    self.db.session.commit()
+                except Exception as exc:  # pragma: no cover
+                    self.db.session.rollback()
+                    log.error(f"Deferred commit failed: {exc}")
+                    # the success body was already serialized, replace it with
+                    # a jsonapi error document (same shape as method_wrapper errors)
+                    errors = [{"title": "Deferred commit failed", "detail": str(exc), "code": 500}]
+                    response.set_data(json.dumps({"errors": errors}))
+                    response.status_code = 500
+            return response
 
         # pylint: disable=unused-argument,unused-variable
         @app.teardown_appcontext
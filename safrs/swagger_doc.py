@@ -389,8 +389,10 @@ def swagger_doc(cls, tags=None):
         inst_sample_data = schema_from_object(inst_model_name, {"data": sample_instance})
         inst_sample_data.description += f"{class_name} {http_method};"
 
-        cls.swagger_models["instance"] = inst_sample_data
-        cls.swagger_models["collection"] = coll_sample_data
+        # Assign a fresh dict: item assignment would mutate the dict shared with
+        # every other class through SAFRSBase, so by the time the deferred
+        # swagger builders run they'd all see the last exposed class's models
+        cls.swagger_models = {"instance": inst_sample_data, "collection": coll_sample_data}
 
         if http_method == "get":
             doc["summary"] = f"Retrieve a {class_name} object"
@@ -533,8 +535,8 @@ def swagger_relationship_doc(cls, tags=None):
 
             rel_post_schema = schema_from_object(model_name, {"data": data})
             rel_post_schema.description += f"{class_name} {http_method} relationship;"
-            cls.swagger_models["instance"] = rel_post_schema
-            cls.swagger_models["collection"] = rel_post_schema
+            # fresh dict, cfr. swagger_doc: don't mutate the dict shared through SAFRSRelationshipObject
+            cls.swagger_models = {"instance": rel_post_schema, "collection": rel_post_schema}
             parameters.append(
                 {
                     "name": f"{class_name} body",